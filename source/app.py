@@ -1,3 +1,4 @@
+import atexit
 import os
 import sys
 from typing import ClassVar, Callable, Iterable
@@ -5,34 +6,67 @@ from typing import ClassVar, Callable, Iterable
 from .book import Book, BookStatus
 from .bookshelf import Bookshelf
 from .command import Command, SupportsCommandsType, command
-from .output import Output
+from .output import Output, enable_virtual_terminal
+
+try:
+    # Gives input() line editing and history where available.
+    import readline
+except ImportError:
+    readline = None
+
+# Erases the whole screen and moves the cursor to the top-left corner.
+CLEAR_SCREEN = '\033[2J\033[H'
+SEPARATOR = '===================='
+HISTORY_FILE = os.path.expanduser('~/.library_history')
+# Maximum number of entries kept in the history file.
+HISTORY_LENGTH = 1000
+
+
+def _save_history() -> None:
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass
 
 
 class App(metaclass=SupportsCommandsType):
     """Main class of the Library app with support of commands."""
     COMMANDS: ClassVar[list[Command]]
+    COMMAND_MAP: ClassVar[dict[str, Command]]
+    # Whether the screen can be cleared with ANSI escape sequences.
+    ansi_clear: ClassVar[bool] = True
 
     def __init__(self) -> None:
         self.output: Output = Output()
-        self.bookshelf: Bookshelf = Bookshelf()
+        self._bookshelf: Bookshelf = Bookshelf()
+
+    @property
+    def bookshelf(self) -> Bookshelf:
+        """Bookshelf of this app, stored books are loaded on first access to it."""
+        if not self._bookshelf.loaded:
+            self.load_books()
+        return self._bookshelf
 
     @command(aliases=['h'])
     def help(self) -> None:
         """Help command, shows a list of all available commands and their descriptions."""
         self.output.info('Here is a list of all available commands:\n')
-        out = '====================\n'
+        parts = [SEPARATOR]
         for cmd in self.COMMANDS:
-            out += f'{" / ".join(cmd.invokable_names)}\n'
+            parts.append(' / '.join(cmd.invokable_names))
             if cmd.description:
-                out += f'| {cmd.description.replace("    ", "")}\n'
+                parts.append(f'| {cmd.description.replace("    ", "")}')
             if params := cmd.parameters:
-                out += f'| Parameters: {" ".join(params)}\n'
-            out += '====================\n'
-        self.output.info(out)
+                parts.append(f'| Parameters: {" ".join(params)}')
+            parts.append(SEPARATOR)
+        parts.append('')
+        self.output.info('\n'.join(parts))
 
     @command(aliases=['+', 'create'])
     def add(self, *title: str) -> None:
         """Command to add a new book. You will need to enter title, author and year."""
+        # Any failure to load stored books is reported before the user starts typing.
+        bookshelf = self.bookshelf
         title = ' '.join(title)
         author = self.input_flow(
             f'Let\'s add a new book "{title}"! Now enter the name of the book author.'
@@ -58,7 +92,7 @@ class App(metaclass=SupportsCommandsType):
         if not year:
             return
 
-        self.bookshelf.add_book(
+        bookshelf.add_book(
             Book(
                 title=title,
                 author=author,
@@ -70,8 +104,9 @@ class App(metaclass=SupportsCommandsType):
     @command(aliases=['list', 'ls', 'all'])
     def books(self) -> None:
         """Command to show all of the stored books."""
+        books = self.bookshelf.books.values()
         self.output.info('Here are list of all stored books:\n')
-        self.show_books(self.bookshelf.books.values())
+        self.show_books(books)
 
     @command(aliases=['s'])
     def status(self, book_id: str, status: str) -> None:
@@ -79,16 +114,15 @@ class App(metaclass=SupportsCommandsType):
 
         Status parameter must be one of 'stock' and 'out'.
         """
-        if book_id not in self.bookshelf.books:
+        book: Book | None = self.bookshelf.get_book(book_id)
+        if book is None:
             self.output.error(f'Book with ID "{book_id}" doesn\'t exist!')
             return
         if status not in {'stock', 'out'}:
             self.output.error('Status parameter must be one of "stock" and "out"!')
             return
 
-        book: Book = self.bookshelf.get_book(book_id)
-        assert book is not None
-        book.status = BookStatus.in_stock if status == 'stock' else BookStatus.handed_over
+        book.status = BookStatus.in_stock.value if status == 'stock' else BookStatus.handed_over.value
         self.bookshelf.add_book(book)
         self.output.info(f'Status of the book "{book.title}" (ID:{book_id}) has been set to "{book.str_status()}"')
 
@@ -150,23 +184,40 @@ class App(metaclass=SupportsCommandsType):
     @command(aliases=['del', 'd'])
     def delete(self, book_id: str) -> None:
         """Command to delete a book by it's ID."""
-        if book_id not in self.bookshelf.books:
+        try:
+            removed = self.bookshelf.remove_book(book_id)
+        except KeyError:
             self.output.error(f'Book with ID "{book_id}" doesn\'t exist!')
             return
 
-        removed = self.bookshelf.remove_book(book_id)
         self.output.info(f'Book with ID "{book_id}" and title "{removed.title}" deleted successfully!')
 
-    @staticmethod
-    def preload() -> None:
+    @classmethod
+    def preload(cls) -> None:
         if sys.platform == 'win32':
-            os.system('title Library')
+            import ctypes
+
+            ctypes.windll.kernel32.SetConsoleTitleW('Library')
+            # clear_screen can use ANSI escape sequences only if the console processes them.
+            cls.ansi_clear = enable_virtual_terminal() is True
 
-    @staticmethod
-    def clear_screen() -> None:
+        if readline is not None:
+            try:
+                readline.read_history_file(HISTORY_FILE)
+            except OSError:
+                pass
+            # Entered titles and authors are stored as well, so the file must not grow forever.
+            readline.set_history_length(HISTORY_LENGTH)
+            atexit.register(_save_history)
+
+    @classmethod
+    def clear_screen(cls) -> None:
         """Function to clear the screen. Platform-independent."""
-        clear_cmd = 'cls' if sys.platform == 'win32' else 'clear'
-        os.system(clear_cmd)
+        if cls.ansi_clear:
+            sys.stdout.write(CLEAR_SCREEN)
+            sys.stdout.flush()
+        else:
+            os.system('cls' if sys.platform == 'win32' else 'clear')
 
     def input_flow(self, title: str, predicate: Callable[[str], bool] | None = None) -> str | None:
         """Creates an input flow to get a correct value.
@@ -201,24 +252,38 @@ class App(metaclass=SupportsCommandsType):
 
     def show_books(self, books: Iterable[Book]) -> None:
         """Prints to output all the books from given iterable."""
-        out = '====================\n'
+        parts = [SEPARATOR]
         for book in books:
-            out += f'| Book "{book.title}"\n'
-            out += f'| Author: {book.author}\n'
-            out += f'| {book.year} year of publishing\n'
-            out += f'| ID: {book.id}\n'
-            out += f'| Status: {book.str_status()}\n'
-            out += '====================\n'
-        self.output.info(out)
+            parts.append(
+                f'| Book "{book.title}"\n'
+                f'| Author: {book.author}\n'
+                f'| {book.year} year of publishing\n'
+                f'| ID: {book.id}\n'
+                f'| Status: {book.str_status()}\n'
+                f'{SEPARATOR}'
+            )
+        parts.append('')
+        self.output.info('\n'.join(parts))
 
     def invoke_command(self, name: str, params: list[str]) -> None:
         """Tries to invoke the command with given name and parameters entered by the user."""
-        self.clear_screen()
-        for cmd in self.COMMANDS:
-            if name in cmd.invokable_names:
-                cmd.invoke(self, params, output=self.output)
-                return
-        self.output.error(f'Unknown command: "{name}"')
+        cmd = self.COMMAND_MAP.get(name)
+        if cmd is None:
+            self.output.error(f'Unknown command: "{name}"')
+            return
+        cmd.invoke(self, params, output=self.output)
+
+    def load_books(self) -> None:
+        """Loads stored books, reporting to user if it fails.
+
+        Called on first access to `bookshelf`, so commands that don't use books never read the data file.
+        """
+        try:
+            self._bookshelf.load_books()
+        except TypeError as e:
+            self.output.error(f'Failed to load stored books: {e}\n')
+            self.output.warning('Book data is not loaded and will be overridden when adding a new book.')
+            self.wait_to_continue()
 
     def wait_to_continue(self) -> None:
         """Method to wait until user presses Enter key. Blocking."""
@@ -232,25 +297,23 @@ class App(metaclass=SupportsCommandsType):
             'You can manage your books here!\n'
             'Enter a command down below. For list of available commands use "help" command.\n'
         )
-        params: list[str] = input('> ').strip().split()
-        if not params:
+        line: str = input('> ').strip()
+        if not line:
             # User entered nothing, reset
             return
+        params: list[str] = line.split()
         name: str = params[0]
         self.invoke_command(name, params[1:])
+        self._bookshelf.commit()
         self.wait_to_continue()
 
     def run(self) -> None:
         """Entrypoint method for the app. Blocking."""
         self.preload()
-        try:
-            self.bookshelf.load_books()
-        except TypeError as e:
-            self.output.error(f'Failed to load stored books: {e}\n')
-            self.output.warning('Book data is not loaded and will be overridden when adding a new book.')
-            self.wait_to_continue()
         try:
             while True:
                 self.tick()
         except KeyboardInterrupt:
             self.output.warning('\nReceived signal to close the app.')
+        finally:
+            self._bookshelf.commit()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import os
 from enum import Enum
 from typing import Any
@@ -24,6 +25,17 @@ class BookStatus(Enum):
     handed_over = 0
 
 
+# Book ids are made of a random per-process prefix and a sequential counter,
+# the prefix keeps them unique across runs of the app sharing the same data file.
+_ID_PREFIX: str = os.urandom(4).hex()
+_ID_COUNTER = itertools.count(1)
+
+_STATUS_STR: dict[int, str] = {
+    BookStatus.in_stock.value: 'In stock',
+    BookStatus.handed_over.value: 'Handed over'
+}
+
+
 class Book:
     """Represents a book in the library.
 
@@ -35,36 +47,35 @@ class Book:
         Name of this book's author.
     year: int
         Number that represents the year this book was published.
-    status: BookStatus
-        Enum representing this book's status in the library.
+    status: int
+        Value of the `BookStatus` representing this book's status in the library.
     id: str
         Unique identifier of this book.
     """
+    __slots__ = ('title', 'author', 'year', 'status', 'id')
+
     def __init__(
             self, *,
             title: str,
             author: str,
             year: int,
-            status: BookStatus | None = None,
+            status: BookStatus | int | None = None,
             id: str | None = None
     ) -> None:
         self.title: str = title
         self.author: str = author
         self.year: int = year
-        self.status: BookStatus = status or BookStatus.in_stock
-        self.id: str = id or os.urandom(6).hex()
+        if isinstance(status, BookStatus):
+            status = status.value
+        self.status: int = status if status is not None else BookStatus.in_stock.value
+        self.id: str = id if id is not None else f'{_ID_PREFIX}{next(_ID_COUNTER):04x}'
 
     def __repr__(self) -> str:
         return f'<Book title={self.title} author={self.author} year={self.year} status={self.status} id={self.id}>'
 
     def str_status(self) -> str:
         """Returns readable string version of the status."""
-        if self.status is BookStatus.in_stock:
-            return 'In stock'
-        elif self.status is BookStatus.handed_over:
-            return 'Handed over'
-        else:
-            return 'Unknown status'
+        return _STATUS_STR.get(self.status, 'Unknown status')
 
     def to_dict(self) -> dict[str, Any]:
         """Converts this Book to JSON serializable object."""
@@ -72,7 +83,7 @@ class Book:
             'title': self.title,
             'author': self.author,
             'year': self.year,
-            'status': self.status.value,
+            'status': self.status,
             'id': self.id
         }
 
@@ -83,6 +94,6 @@ class Book:
             title=data['title'],
             author=data['author'],
             year=int(data['year']),
-            status=BookStatus(int(data['status'])),
+            status=BookStatus(int(data['status'])).value,
             id=data['id']
         )
@@ -1,14 +1,40 @@
 import json
-import os.path
-from typing import Final, Any
+import os
+from typing import ClassVar, Final, Any
 
 from .book import Book
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _book_default(obj: Any) -> Any:
+    if isinstance(obj, Book):
+        return obj.to_dict()
+    raise TypeError(f'Object of type {type(obj)} is not JSON serializable')
+
+
+# Serialization of the data file, uses orjson if it's installed.
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_book_default, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_book_default, indent=2, ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+
 
 class Bookshelf:
     """Represents a bookshelf where books is stored.
 
     By default this class stores all the books in `books.json`.
+    Books are loaded from the file on first access to them,
+    changes are kept in memory until `commit` is called.
 
     Attributes
     ----------
@@ -16,63 +42,111 @@ class Bookshelf:
         Name of the file where the books will be saved.
     books: dict[str, Book]
         Mapping of Book.id to Book.
+    loaded: bool
+        Whether loading of the books from the file was already attempted.
     """
+    # Decoded data files by path, along with the inode, mtime and size they were read with.
+    _cache: ClassVar[dict[str, tuple[int, int, int, dict[str, dict[str, Any]]]]] = {}
 
     def __init__(self, file_path: str = 'books.json') -> None:
         self.file_path: str = file_path
-        self.books: dict[str, Book] = {}
-
-    def _json_default(self, obj: Any) -> Any:
-        if isinstance(obj, Book):
-            return obj.to_dict()
-        raise TypeError(f'Object of type {type(obj)} is not JSON serializable')
+        self.loaded: bool = False
+        self._books: dict[str, Book] = {}
+        self._dirty: bool = False
+        # Snapshot of the books as they are stored in the data file.
+        self._saved: tuple[tuple[Any, ...], ...] | None = None
+
+    @property
+    def books(self) -> dict[str, Book]:
+        """Mapping of Book.id to Book, loaded from the data file on first access."""
+        if not self.loaded:
+            self.load_books()
+        return self._books
+
+    def _snapshot(self) -> tuple[tuple[Any, ...], ...]:
+        return tuple(
+            (book.id, book.title, book.author, book.year, book.status)
+            for book in self.books.values()
+        )
 
     def load_books(self) -> None:
         """Method to load books from the data file.
 
         If some book data from the file invalid it will be ignored during loading.
+        Decoded data is cached per process, so loading an unchanged file again
+        doesn't parse it twice.
+        This is called automatically on first access to `books`; if it fails
+        the bookshelf stays empty and the file is not read again.
 
         Raises
         ------
         TypeError
             If the data in file were corrupted or invalid.
         """
-        if not os.path.exists(self.file_path):
+        self.loaded = True
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            return
+        if st.st_size == 0:
             return
 
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            try:
-                data: dict[str, dict[str, Any]] = json.load(f)
-            except json.JSONDecodeError as e:
-                raise TypeError(f'Could not decode data in file "{self.file_path}": {e}')
+        cached = self._cache.get(self.file_path)
+        if cached is not None and cached[:3] == (st.st_ino, st.st_mtime_ns, st.st_size):
+            data = cached[3]
+        else:
+            with open(self.file_path, 'rb') as f:
+                try:
+                    data: dict[str, dict[str, Any]] = _loads(f.read())
+                except ValueError as e:
+                    raise TypeError(f'Could not decode data in file "{self.file_path}": {e}')
             if not isinstance(data, dict):
                 raise TypeError(f'Invalid data in file "{self.file_path}": expected object got array')
+            self._cache[self.file_path] = (st.st_ino, st.st_mtime_ns, st.st_size, data)
 
         for obj in data.values():
             try:
                 book = Book.from_dict(obj)
             except (KeyError, ValueError, TypeError):
                 continue
-            self.books[book.id] = book
+            self._books[book.id] = book
+        self._saved = self._snapshot()
 
     def save_books(self) -> None:
-        """Method to save currently cached books to the data file."""
-        dump: str = json.dumps(
-            self.books,
-            default=self._json_default,
-            indent=2
-        )
-        with open(self.file_path, 'w', encoding='utf-8') as f:
+        """Method to save currently cached books to the data file.
+
+        The data is written to a temporary file first which then replaces
+        the data file, so the file is never left partially written.
+        Nothing is written if the books didn't change since the last save or load.
+        """
+        snapshot = self._snapshot()
+        if snapshot == self._saved:
+            self._dirty = False
+            return
+
+        dump: bytes = _dumps(self.books)
+        tmp_path = self.file_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
             f.write(dump)
+        os.replace(tmp_path, self.file_path)
+        self._cache.pop(self.file_path, None)
+        self._saved = snapshot
+        self._dirty = False
+
+    def commit(self) -> None:
+        """Method to save the changes made since the last save, if any."""
+        if not self._dirty:
+            return
+        self.save_books()
 
     def add_book(self, book: Book) -> None:
         """Method to add a book.
 
         If the book with this ID already exists it will be overwritten.
-        This method automatically saves the data to file.
+        The change will be saved to file on the next `commit`.
         """
         self.books[book.id] = book
-        self.save_books()
+        self._dirty = True
 
     def get_book(self, book_id: str) -> Book | None:
         """Method to get a book by it's id.
@@ -87,7 +161,7 @@ class Bookshelf:
     def remove_book(self, book_id: str) -> Book:
         """Removes the book with provided id.
 
-        This method automatically saves the data to file.
+        The change will be saved to file on the next `commit`.
 
         Raises
         ------
@@ -100,5 +174,5 @@ class Bookshelf:
             Book that was deleted.
         """
         book = self.books.pop(book_id)
-        self.save_books()
+        self._dirty = True
         return book
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import inspect
-from typing import Callable, Optional, get_args, Any
+from typing import Callable, Optional, get_args, get_type_hints, Any
 from .output import Output
 
 __all__ = (
@@ -12,7 +12,37 @@ __all__ = (
 OPTIONALS = frozenset({Optional[str], Optional[int], Optional[float], Optional[bool]})
 TRUE_EXPRESSIONS = frozenset({'true', 'yes', '1', 't', 'y'})
 FALSE_EXPRESSIONS = frozenset({'false', 'no', '0', 'f', 'n'})
+BOOL_EXPRESSIONS = dict.fromkeys(TRUE_EXPRESSIONS, True) | dict.fromkeys(FALSE_EXPRESSIONS, False)
 CommandFunc = Callable
+ArgumentParser = Callable[[list[str]], list[Any]]
+
+
+class _Parameter:
+    """Positional parameter of the command callback."""
+    __slots__ = ('name', 'annotation', 'variadic')
+
+    def __init__(self, name: str, annotation: Any, variadic: bool = False) -> None:
+        self.name: str = name
+        self.annotation: Any = annotation
+        # Whether this is the "*" parameter.
+        self.variadic: bool = variadic
+
+
+class _UsageError(Exception):
+    """Raised by the argument parser when not enough arguments were given."""
+
+
+class _ArgumentError(Exception):
+    """Raised by the argument parser when an argument could not be converted."""
+    def __init__(self, name: str, expected: type, given: str) -> None:
+        super().__init__(name, expected, given)
+        self.name: str = name
+        self.expected: type = expected
+        self.given: str = given
+
+
+def _to_bool(given: str) -> bool:
+    return BOOL_EXPRESSIONS.get(given, bool(given))
 
 
 class Command:
@@ -22,6 +52,15 @@ class Command:
     Callback function of the command must have all parameters (except self)
     typehinted with acceptable type (one of str, int, float, bool).
     Only positional parameters are allowed.
+
+    Attributes
+    ----------
+    invokable_names: tuple[str, ...]
+        Names with which this command can be invoked.
+    parameters: list[str]
+        Formatted parameters that this command accepts.
+    required_count: int
+        Number of arguments that must be given to invoke this command.
     """
     def __init__(
             self,
@@ -35,19 +74,18 @@ class Command:
         self.name: str = name
         self.description: str | None = description
         self.aliases: list[str] | None = aliases
-        self._parameters: list[inspect.Parameter] = self._get_valid_arguments(func)
-
-    @property
-    def invokable_names(self) -> tuple[str, ...]:
-        """Returns a tuple of names with which this command can be invoked."""
-        if self.aliases:
-            return self.name, *self.aliases
-        return self.name,
-
-    @property
-    def parameters(self) -> list[str]:
-        """Returns list of formatted parameters that this command accepts."""
-        return [self._format_param(param) for param in self._parameters]
+        self._parameters: list[_Parameter] = self._get_valid_arguments(func)
+        self.invokable_names: tuple[str, ...] = (name, *(aliases or ()))
+        self.parameters: list[str] = [self._format_param(param) for param in self._parameters]
+        self.required_count: int = sum(
+            1 for param in self._parameters
+            if param.annotation not in OPTIONALS
+        )
+        self._param_types: list[type] = [
+            param.annotation if param.annotation not in OPTIONALS else get_args(param.annotation)[0]
+            for param in self._parameters
+        ]
+        self._parse: ArgumentParser = self._build_parser()
 
     def _validate_func(self, func: CommandFunc) -> CommandFunc:
         if isinstance(func, classmethod):
@@ -55,20 +93,50 @@ class Command:
 
         if isinstance(func, staticmethod):
             raise TypeError('Console command cannot be a staticmethod.')
+        return func
 
-        params = list(inspect.signature(func).parameters.values())
+    def _introspect(self, func: CommandFunc) -> tuple[list[_Parameter], tuple[str, ...]]:
+        """Reads the parameters of the function directly from its code object.
+
+        This is much cheaper than building an `inspect.Signature`.
+
+        Returns
+        -------
+        tuple[list[_Parameter], tuple[str, ...]]
+            Positional parameters (except self) and names of keyword parameters.
+        """
+        # Parameters of decorated functions are those of the original one, like in `inspect.signature`.
+        target = inspect.unwrap(func)
+        code = target.__code__
+        annotations = target.__annotations__
+        if any(isinstance(annotation, str) for annotation in annotations.values()):
+            # Postponed evaluation of annotations, resolve them to real types.
+            annotations = get_type_hints(target)
+
+        names = code.co_varnames
+        end = code.co_argcount + code.co_kwonlyargcount
+        params = [
+            _Parameter(name, annotations.get(name, inspect.Parameter.empty))
+            for name in names[:code.co_argcount]
+            if name != 'self'
+        ]
+        keywords = names[code.co_argcount:end]
+        if code.co_flags & inspect.CO_VARARGS:
+            name = names[end]
+            params.append(_Parameter(name, annotations.get(name, inspect.Parameter.empty), variadic=True))
+            end += 1
+        if code.co_flags & inspect.CO_VARKEYWORDS:
+            keywords += (names[end],)
+        return params, keywords
+
+    def _get_valid_arguments(self, func: CommandFunc) -> list[_Parameter]:
+        params, keywords = self._introspect(func)
         valid_types = {str, int, float, bool} | OPTIONALS
 
         for param in params:
-            if param.name == 'self' or param.kind is param.VAR_POSITIONAL:
+            if param.variadic:
                 continue
 
-            if param.kind is param.VAR_KEYWORD or param.kind is param.KEYWORD_ONLY:
-                raise TypeError(
-                    f'Console command cannot contain keyword arguments (wrong argument: {param.name}).'
-                    f' in function {func.__name__}'
-                )
-
             if param.annotation not in valid_types or not hasattr(param.annotation, '__name__'):
                 raise TypeError(
                     f'Console command must have all parameters annotated with one of: str, int, float, bool'
@@ -77,36 +145,52 @@ class Command:
                     f' (wrong argument: {param.name})'
                     f' in function {func.__name__}'
                 )
-        return func
 
-    def _get_valid_arguments(self, func: CommandFunc) -> list[inspect.Parameter]:
-        return [
-            param
-            for param in inspect.signature(func).parameters.values()
-            if self._check_param(param)
+        if keywords:
+            raise TypeError(
+                f'Console command cannot contain keyword arguments (wrong argument: {keywords[0]}).'
+                f' in function {func.__name__}'
+            )
+        return params
+
+    def _build_parser(self) -> ArgumentParser:
+        """Builds a function that converts raw parameters entered by user to the callback arguments.
+
+        Everything that doesn't change between invocations (arity, converters,
+        whether the last parameter is "*" one) is resolved here once.
+        """
+        variadic = bool(self._parameters) and self._parameters[-1].variadic
+        positional = [
+            (param.name, _type, _to_bool if _type is bool else _type)
+            for param, _type in zip(self._parameters, self._param_types)
+            if not param.variadic
         ]
+        count = len(positional)
+        required = self.required_count
 
-    def _get_required_count(self) -> int:
-        return sum(
-            1 for param in self._parameters
-            if param.annotation not in OPTIONALS
-        )
+        def parse(params: list[str]) -> list[Any]:
+            ready = []
+            for (name, _type, convert), given in zip(positional, params):
+                try:
+                    ready.append(convert(given))
+                except (TypeError, ValueError):
+                    raise _ArgumentError(name, _type, given) from None
+            if variadic:
+                ready.extend(params[count:])
+            if len(ready) < required:
+                raise _UsageError
+            return ready
 
-    def _check_param(self, param: inspect.Parameter) -> bool:
-        return (
-                param.kind is param.POSITIONAL_OR_KEYWORD
-                or param.kind is param.POSITIONAL_ONLY
-                or param.kind is param.VAR_POSITIONAL
-        ) and param.name != 'self'
+        return parse
 
     def _print_usage(self, output: Output) -> None:
-        u = ' '.join(self._format_param(param) for param in self._parameters)
+        u = ' '.join(self.parameters)
         output.error(f'Usage: {" | ".join(self.invokable_names)} {u}')
 
     def _print_expected(self, name: str, expected: type, given: str, output: Output) -> None:
         output.error(f'Expected "{name}" argument to be {expected.__name__}, got "{given}"')
 
-    def _format_param(self, param: inspect.Parameter) -> str:
+    def _format_param(self, param: _Parameter) -> str:
         return f'<{param.name}: {param.annotation.__name__ if param.annotation not in OPTIONALS else param.annotation}>'
 
     def invoke(self, cls: Any, params: list[str], *, output: Output) -> None:
@@ -121,32 +205,11 @@ class Command:
         output: Output
             The output for this command.
         """
-        ready = []
-        for i, given in enumerate(params):
-            if not self._parameters:
-                break
-            try:
-                p = self._parameters[i]
-            except IndexError:
-                p = self._parameters[-1]
-                if p.kind is not p.VAR_POSITIONAL:
-                    break
-            if p.kind is p.VAR_POSITIONAL:
-                ready.append(given)
-                continue
-
-            _type = p.annotation if p.annotation not in OPTIONALS else get_args(p.annotation)[0]
-            if _type is bool:
-                if given in TRUE_EXPRESSIONS:
-                    given = 1
-                elif given in FALSE_EXPRESSIONS:
-                    given = 0
-            try:
-                ready.append(_type(given))
-            except (TypeError, ValueError):
-                return self._print_expected(p.name, _type, given, output)
-
-        if len(ready) < self._get_required_count():
+        try:
+            ready = self._parse(params)
+        except _ArgumentError as e:
+            return self._print_expected(e.name, e.expected, e.given, output)
+        except _UsageError:
             return self._print_usage(output)
         try:
             self.func(cls, *ready)
@@ -159,7 +222,8 @@ class SupportsCommandsType(type):
 
     This metaclass must be used on a class where you want support for the commands.
     This will add a class variable `COMMANDS` which will hold all defined commands
-    in this class as a list of `Command`.
+    in this class as a list of `Command`, and a class variable `COMMAND_MAP`
+    which maps every invokable name of each command to its `Command`.
     """
     def __new__(
             metacls,
@@ -172,6 +236,12 @@ class SupportsCommandsType(type):
             if isinstance(value, Command):
                 commands.append(value)
         attrs['COMMANDS'] = commands
+        command_map: dict[str, Command] = {}
+        for cmd in commands:
+            for invokable_name in cmd.invokable_names:
+                # The first defined command takes a name shared by several commands.
+                command_map.setdefault(invokable_name, cmd)
+        attrs['COMMAND_MAP'] = command_map
         return super().__new__(metacls, name, bases, attrs)
 
 
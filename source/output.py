@@ -1,88 +1,341 @@
 from __future__ import annotations
 
-from typing import Any
+import functools
+import os
+import sys
+from typing import Any, Callable, Iterable
 
 __all__ = (
     'Output',
 )
 
+RESET_ALL = '\033[0m'
+BRIGHT = '\033[1m'
+DIM = '\033[2m'
+NORMAL = '\033[22m'
 
-class _AnsiType(type):
-    def __new__(
-            cls,
-            name: str,
-            bases: tuple[type, ...],
-            attrs: dict[str, Any]
-    ) -> _AnsiType:
-        names: list[str] = [name for name in attrs if not name.startswith('_')]
-        for name in names:
-            value = attrs[name]
-            if not isinstance(value, int):
-                continue
-            attrs[name] = '\033[' + str(value) + 'm'
-        return super().__new__(cls, name, bases, attrs)
-
-
-class Back(metaclass=_AnsiType):
-    BLACK = 40
-    RED = 41
-    GREEN = 42
-    YELLOW = 43
-    BLUE = 44
-    MAGENTA = 45
-    CYAN = 46
-    WHITE = 47
-    RESET = 49
-
-
-class Fore(metaclass=_AnsiType):
-    BLACK = 30
-    RED = 31
-    GREEN = 32
-    YELLOW = 33
-    BLUE = 34
-    MAGENTA = 35
-    CYAN = 36
-    WHITE = 37
-    RESET = 39
-
-
-class Style(metaclass=_AnsiType):
-    BRIGHT = 1
-    DIM = 2
-    NORMAL = 22
-    RESET_ALL = 0
+FG_BLACK = '\033[30m'
+FG_RED = '\033[31m'
+FG_GREEN = '\033[32m'
+FG_YELLOW = '\033[33m'
+FG_BLUE = '\033[34m'
+FG_MAGENTA = '\033[35m'
+FG_CYAN = '\033[36m'
+FG_WHITE = '\033[37m'
+FG_RESET = '\033[39m'
+
+BG_BLACK = '\033[40m'
+BG_RED = '\033[41m'
+BG_GREEN = '\033[42m'
+BG_YELLOW = '\033[43m'
+BG_BLUE = '\033[44m'
+BG_MAGENTA = '\033[45m'
+BG_CYAN = '\033[46m'
+BG_WHITE = '\033[47m'
+BG_RESET = '\033[49m'
+
+_INFO_PRE = RESET_ALL + FG_GREEN
+_WARN_PRE = RESET_ALL + FG_YELLOW + BRIGHT
+_ERR_PRE = RESET_ALL + FG_RED + BRIGHT
+_ERR_TEMPLATE = _ERR_PRE + '%s' + RESET_ALL + '\n'
+# Approximate number of characters written at once by the batch methods.
+_BATCH_SIZE = 65536
+
+
+class Back:
+    """Background colors, aliases of the ``BG_*`` constants."""
+    BLACK = BG_BLACK
+    RED = BG_RED
+    GREEN = BG_GREEN
+    YELLOW = BG_YELLOW
+    BLUE = BG_BLUE
+    MAGENTA = BG_MAGENTA
+    CYAN = BG_CYAN
+    WHITE = BG_WHITE
+    RESET = BG_RESET
+
+
+class Fore:
+    """Foreground colors, aliases of the ``FG_*`` constants."""
+    BLACK = FG_BLACK
+    RED = FG_RED
+    GREEN = FG_GREEN
+    YELLOW = FG_YELLOW
+    BLUE = FG_BLUE
+    MAGENTA = FG_MAGENTA
+    CYAN = FG_CYAN
+    WHITE = FG_WHITE
+    RESET = FG_RESET
+
+
+class Style:
+    """Text styles, aliases of the style constants."""
+    BRIGHT = BRIGHT
+    DIM = DIM
+    NORMAL = NORMAL
+    RESET_ALL = RESET_ALL
+
+
+STD_OUTPUT_HANDLE = -11
+STD_ERROR_HANDLE = -12
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+# Whether the file descriptor is a terminal, by file descriptor.
+_TTY_CACHE: dict[int, bool] = {}
+
+
+@functools.cache
+def _env_color_support() -> bool | None:
+    # Environment doesn't change during the process lifetime.
+    # Explicit user preferences, see https://no-color.org and https://bixense.com/clicolors.
+    if os.environ.get('NO_COLOR'):
+        return False
+    if os.environ.get('CLICOLOR_FORCE', '0') != '0':
+        return True
+    if 'PYCHARM_HOSTED' in os.environ or 'WT_SESSION' in os.environ:
+        # PyCharm run console and Windows Terminal render colors.
+        return True
+    if os.environ.get('TERM') == 'dumb':
+        return False
+    return None
+
+
+def _isatty(stream: Any) -> bool:
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a file descriptor, so checking it costs no system call.
+        return hasattr(stream, 'isatty') and stream.isatty()
+    try:
+        return _TTY_CACHE[fd]
+    except KeyError:
+        result = _TTY_CACHE[fd] = os.isatty(fd)
+        return result
+
+
+@functools.cache
+def enable_virtual_terminal(std_handle: int = STD_OUTPUT_HANDLE) -> bool | None:
+    """Enables processing of ANSI escape sequences by the Windows console of a standard handle.
+
+    This is done once per process and handle, subsequent calls return the cached result.
+
+    Parameters
+    ----------
+    std_handle: int
+        The standard handle of the console, ``STD_OUTPUT_HANDLE`` or ``STD_ERROR_HANDLE``.
+        Defaults to ``STD_OUTPUT_HANDLE``.
+
+    Returns
+    -------
+    bool | None
+        ``True`` if escape sequences are processed, ``False`` if the console doesn't support it
+        and ``None`` if the handle is not a Windows console.
+    """
+    if sys.platform != 'win32':
+        return None
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(std_handle)
+    mode = ctypes.c_ulong()
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return None
+    return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+
+
+def _detect_color_support(stream: Any, std_handle: int = STD_OUTPUT_HANDLE) -> bool:
+    supported = _env_color_support()
+    if supported is None:
+        # Legacy Windows consoles print escape sequences as is.
+        supported = enable_virtual_terminal(std_handle)
+    if supported is None:
+        supported = _isatty(stream)
+    return supported
 
 
 class Output:
     """Represents the output handler for this app.
 
+    Messages are written to the binary buffer of standard output
+    and are not flushed line by line, so consecutive messages are coalesced
+    into a single write. The buffer is flushed on `flush`, on each `error`,
+    and whenever standard output itself is flushed (e.g. by ``input()``).
+    Run Python with ``-u`` or ``PYTHONUNBUFFERED`` set to write every message immediately.
+    Errors are written to standard error right away, colored if standard error
+    itself supports it when ``use_color`` is detected.
+    The current `sys.stdout` is looked up on each call, so redirecting it
+    (e.g. with ``contextlib.redirect_stdout``) takes effect on the next message.
+
     Parameters
     ----------
-    use_color: bool
+    use_color: bool | None
         Whether to use colored output.
-        Defaults to ``True``.
+        Defaults to ``None`` which means it is detected with `is_color_supported`.
+    refresh: bool
+        Whether to detect color support again instead of using the cached results.
+        Only makes sense when ``use_color`` is ``None``.
+        Defaults to ``False``.
     """
+    __slots__ = (
+        'use_color',
+        '_auto_color',
+        '_stream',
+        '_buffer',
+        '_encoding',
+        '_errors',
+        '_stream_write',
+        '_buffer_write',
+        '_write',
+        '_info_pre',
+        '_warn_pre',
+        '_suf',
+        '_info_sep',
+        '_err_template',
+        '_err_stream',
+        '_err_encoding',
+        '_err_fd'
+    )
+
     def __init__(
             self, *,
-            use_color: bool = True
+            use_color: bool | None = None,
+            refresh: bool = False
     ) -> None:
+        self._auto_color: bool = use_color is None
+        if use_color is None:
+            if refresh:
+                _env_color_support.cache_clear()
+                _TTY_CACHE.clear()
+            use_color = self.is_color_supported()
         self.use_color: bool = use_color
 
+        self._bind_stream(sys.stdout)
+
+        self._bind_err_stream(sys.stderr)
+
+    @staticmethod
+    def is_color_supported() -> bool:
+        """Returns whether standard output supports colored text.
+
+        Environment variables are read once per process, and whether
+        standard output is a terminal is checked once per file descriptor.
+        """
+        return _detect_color_support(sys.stdout)
+
+    def _bind_stream(self, stream: Any) -> None:
+        # Standard output is replaced by e.g. contextlib.redirect_stdout,
+        # so everything derived from it is set up again when it changes.
+        self._stream = stream
+        self._buffer = getattr(stream, 'buffer', None)
+        self._encoding: str = getattr(stream, 'encoding', None) or 'utf-8'
+        self._errors: str = getattr(stream, 'errors', None) or 'strict'
+        use_color = self.use_color
+        # Picked once here so that writing a message doesn't branch on the stream kind or colors.
+        if self._buffer is None:
+            self._stream_write: Callable[[str], Any] = stream.write
+            self._write: Callable[[Any, str], None] = self._write_text if use_color else self._write_plain_text
+        else:
+            self._buffer_write: Callable[[bytes], Any] = self._buffer.write
+            self._write = self._write_buffer if use_color else self._write_plain_buffer
+
+        # Prefixes and suffix wrapping the text of each level, encoded once.
+        if use_color:
+            self._info_pre: bytes | str = self._encode(_INFO_PRE)
+            self._warn_pre: bytes | str = self._encode(_WARN_PRE)
+            self._suf: bytes | str = self._encode(RESET_ALL + '\n')
+            # Goes between texts joined into a single message.
+            self._info_sep: str = RESET_ALL + '\n' + _INFO_PRE
+        else:
+            self._info_pre = self._warn_pre = self._encode('')
+            self._suf = self._encode('\n')
+            self._info_sep = '\n'
+
+    def _bind_err_stream(self, stream: Any) -> None:
+        self._err_stream = stream
+        self._err_encoding: str = getattr(stream, 'encoding', None) or 'utf-8'
+        # Standard error may be redirected independently of standard output.
+        if self._auto_color:
+            use_color = _detect_color_support(stream, STD_ERROR_HANDLE)
+        else:
+            use_color = self.use_color
+        self._err_template: str = _ERR_TEMPLATE if use_color else '%s\n'
+        # Errors are written straight to the file descriptor, bypassing the text layer.
+        # Windows consoles don't take encoded bytes written this way, so they use the stream.
+        self._err_fd: int | None = None
+        if sys.platform != 'win32':
+            try:
+                self._err_fd = stream.fileno()
+            except (AttributeError, OSError, ValueError):
+                pass
+
+    def _encode(self, text: str) -> bytes | str:
+        # Text streams take str as is, only byte buffers need it encoded.
+        if self._buffer is None:
+            return text
+        return text.encode(self._encoding, self._errors)
+
+    def _write_buffer(self, prefix: bytes, text: str) -> None:
+        self._buffer_write(b''.join((prefix, text.encode(self._encoding, self._errors), self._suf)))
+
+    def _write_plain_buffer(self, prefix: bytes, text: str) -> None:
+        self._buffer_write(text.encode(self._encoding, self._errors) + self._suf)
+
+    def _write_plain_text(self, prefix: str, text: str) -> None:
+        self._stream_write(text + '\n')
+
+    def _write_text(self, prefix: str, text: str) -> None:
+        # Stream without a binary buffer, e.g. io.StringIO.
+        self._stream_write(''.join((prefix, text, self._suf)))
+
+    def flush(self) -> None:
+        """Flushes all the buffered output."""
+        if sys.stdout is not self._stream:
+            self._bind_stream(sys.stdout)
+        self._stream.flush()
+
     def info(self, text: str) -> None:
         """Shows text as information."""
-        if self.use_color:
-            text = f'{Style.RESET_ALL}{Fore.GREEN}{text}{Style.RESET_ALL}'
-        print(text)
+        if sys.stdout is not self._stream:
+            self._bind_stream(sys.stdout)
+        self._write(self._info_pre, text)
+
+    def info_many(self, texts: Iterable[str]) -> None:
+        """Shows each of the texts as information.
+
+        This is the same as calling `info` for each text, but the texts
+        are joined and written in batches instead of one by one.
+        """
+        if sys.stdout is not self._stream:
+            self._bind_stream(sys.stdout)
+        batch: list[str] = []
+        size = 0
+        for text in texts:
+            batch.append(text)
+            size += len(text)
+            if size >= _BATCH_SIZE:
+                self._write(self._info_pre, self._info_sep.join(batch))
+                batch.clear()
+                size = 0
+        if batch:
+            self._write(self._info_pre, self._info_sep.join(batch))
 
     def warning(self, text: str) -> None:
         """Shows text as warning."""
-        if self.use_color:
-            text = f'{Style.RESET_ALL}{Fore.YELLOW}{Style.BRIGHT}{text}{Style.RESET_ALL}'
-        print(text)
+        if sys.stdout is not self._stream:
+            self._bind_stream(sys.stdout)
+        self._write(self._warn_pre, text)
 
     def error(self, text: str) -> None:
-        """Shows text as error."""
-        if self.use_color:
-            text = f'{Style.RESET_ALL}{Fore.RED}{Style.BRIGHT}{text}{Style.RESET_ALL}'
-        print(text)
+        """Shows text as error on standard error."""
+        # Pending messages must appear before the error.
+        self.flush()
+        if sys.stderr is not self._err_stream:
+            self._bind_err_stream(sys.stderr)
+        payload = self._err_template % text
+        if self._err_fd is None:
+            self._err_stream.write(payload)
+            self._err_stream.flush()
+            return
+        data = payload.encode(self._err_encoding, 'backslashreplace')
+        while data:
+            data = data[os.write(self._err_fd, data):]